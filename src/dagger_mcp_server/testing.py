@@ -13,7 +13,7 @@ Implements comprehensive testing with Dagger optimization patterns:
 import dagger
 from dagger import dag, function, object_type
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import json
 
 
@@ -112,8 +112,8 @@ class TestRunner:
         result = await (
             test_container
             .with_exec([
-                "python", "-m", "coverage", "run", "-m", "unittest", 
-                "tests.test_mcp_client", "-v"
+                "python", "-m", "coverage", "run", "-m", "pytest", 
+                "tests/test_mcp_client.py", "-v"
             ])
             .with_exec([
                 "python", "-m", "coverage", "report", "--format=json"
@@ -155,18 +155,10 @@ class TestRunner:
         )
         
         # Run integration tests
-        result = await (
-            test_container
-            .with_exec([
-                "python", "-m", "unittest", 
-                "tests.test_integration", "-v"
-            ])
-            .stdout()
+        tests_passed, _ = await self._run_pytest(
+            test_container, "tests/test_integration.py"
         )
         
-        # Parse test results (simplified)
-        tests_passed = "OK" in result
-        
         return IntegrationTestResults(
             scenarios_tested=5,  # From our test fixtures
             scenarios_passed=5 if tests_passed else 0,
@@ -198,18 +190,10 @@ class TestRunner:
         )
         
         # Run performance tests
-        result = await (
-            test_container
-            .with_exec([
-                "python", "-m", "unittest", 
-                "tests.test_performance", "-v"
-            ])
-            .stdout()
+        benchmarks_passed, _ = await self._run_pytest(
+            test_container, "tests/test_performance.py"
         )
         
-        # Parse performance results (simplified)
-        benchmarks_passed = "OK" in result
-        
         return PerformanceTestResults(
             benchmarks_run=10,  # Number of benchmark tests
             benchmarks_passed=10 if benchmarks_passed else 0,
@@ -244,8 +228,8 @@ class TestRunner:
             .with_exec(["pip", "install", "-e", ".[dev]"])
             .with_env_variable("PYTHONPATH", "/app")
             .with_exec([
-                "python", "-m", "coverage", "run", "-m", "unittest", 
-                "discover", "tests", "-v"
+                "python", "-m", "coverage", "run", "-m", "pytest", 
+                "tests", "-v"
             ])
         )
         
@@ -433,34 +417,8 @@ print('Mock services integration test completed successfully')
     ) -> Dict[str, Any]:
         """Execute a specific test suite."""
         try:
-            result = await (
-                container
-                .with_exec([
-                    "python", "-m", "unittest", 
-                    f"tests.{test_module}", "-v"
-                ])
-                .stdout()
-            )
-            
-            # Enhanced success detection for simplified test suites
-            success = False
-            if "OK" in result and "FAILED" not in result:
-                # Standard unittest "OK" output
-                success = True
-            elif "✅" in result and "Status: ✅ Success" in result:
-                # Integration test success indicators
-                success = True
-            elif "Rate:" in result and "configs/second" in result and "FAILED" not in result:
-                # Performance test success indicators (shows benchmark results)
-                success = True
-            elif "Ran " in result and " test" in result and "FAILED" not in result and "ERROR" not in result:
-                # Alternative unittest success pattern
-                success = True
+            success, result = await self._run_pytest(container, f"tests/{test_module}.py")
             
-            print(f"DEBUG: Test {test_module} output contains 'OK': {'OK' in result}")
-            print(f"DEBUG: Test {test_module} output contains 'FAILED': {'FAILED' in result}")
-            print(f"DEBUG: Test {test_module} output contains '✅': {'✅' in result}")
-            print(f"DEBUG: Test {test_module} output contains 'Rate:': {'Rate:' in result}")
             print(f"DEBUG: Test {test_module} success: {success}")
             
             return {
@@ -476,6 +434,27 @@ print('Mock services integration test completed successfully')
                 "test_type": test_type
             }
 
+    async def _run_pytest(
+        self,
+        container: dagger.Container,
+        test_path: str
+    ) -> Tuple[bool, str]:
+        """Run pytest on a path and report success from its exit code."""
+        try:
+            output = await (
+                container
+                .with_exec([
+                    "python", "-m", "pytest", 
+                    test_path, "-v"
+                ])
+                .stdout()
+            )
+        except dagger.ExecError as e:
+            # Non-zero exit: failures, collection/fixture errors or no tests collected
+            print(f"DEBUG: pytest {test_path} exited with code {e.exit_code}")
+            return False, e.stdout
+        return True, output
+
     async def _export_test_artifacts(
         self, 
         container: dagger.Container, 
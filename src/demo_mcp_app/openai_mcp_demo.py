@@ -7,9 +7,12 @@ with proper resource management, error handling, and configurability.
 
 import asyncio
 import logging
+import os
+import re
+import textwrap
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from agents import Agent, Runner
 from agents.mcp import MCPServerStdio, MCPServerStdioParams
 from dotenv import load_dotenv
@@ -18,6 +21,19 @@ from dotenv import load_dotenv
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Response formatting patterns, compiled once at import
+_ISSUE_HEADER_RE = re.compile(r'\*\*\[?MCP-\d+\]?\*\*')
+_ISSUE_KEY_RE = re.compile(r'MCP-\d+')
+_ISSUE_NUMBER_RE = re.compile(r'MCP-(\d+)')
+_DESCRIPTION_RE = re.compile(r'Description[:\*\s]*([^-\n]+?)(?:\s*-|\s*Status|$)')
+_STATUS_RE = re.compile(r'Status[:\*\s]*([^-\n]+?)(?:\s*-|\s*Priority|$)')
+_PRIORITY_RE = re.compile(r'Priority[:\*\s]*([^-\n]+?)(?:\s*-|\s*Assignee|$)')
+_DEPENDENCY_RELATION_RE = re.compile(r'MCP-\d+.*(?:should|must|needs).*(?:before|after|depend).*MCP-\d+', re.IGNORECASE)
+_ARROW_DEPENDENCY_RE = re.compile(r'MCP-\d+.*(?:→|->).*MCP-\d+')
+_NUMBERED_PAIR_RE = re.compile(r'^\d+\.\s.*MCP-\d+.*MCP-\d+')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_LINK_TYPE_RE = re.compile(r'(?:link type|type)[:"\s]*([A-Za-z\s]+?)(?:["\n]|$)', re.IGNORECASE)
+
 @dataclass
 class MCPConfig:
     """Configuration for MCP server connection."""
@@ -27,8 +43,6 @@ class MCPConfig:
     mcp_command: str = "mcp-atlassian"
     
     def __post_init__(self):
-        import os
-        
         # Allow environment variable override if needed
         self.container_name = os.getenv('MCP_CONTAINER_NAME', self.container_name)
             
@@ -152,13 +166,20 @@ class OptimizedMCPClient:
         Raises:
             RuntimeError: If not connected or query fails
         """
+        previous_response_id = self._last_response_id if use_conversation_context else None
+        response, response_id = await self._run_query(question, max_retries, previous_response_id)
+        self._record_exchange(question, response, response_id)
+        return response
+    
+    async def _run_query(
+        self, question: str, max_retries: int, previous_response_id: Optional[str]
+    ) -> Tuple[str, str]:
+        """Run a query with retries and return (response, response ID) without recording it."""
         if not self._connected or not self._agent:
             raise RuntimeError("Client not connected. Use async with client.connect():")
         
         for attempt in range(max_retries):
             try:
-                # Use conversation context if enabled and available
-                previous_response_id = self._last_response_id if use_conversation_context else None
                 if previous_response_id:
                     logger.info(f"🧠 Using conversation context: {previous_response_id[:12]}...")
                 else:
@@ -173,17 +194,8 @@ class OptimizedMCPClient:
                 )
                 
                 response = result.final_output_as(str)
-                
-                # Update conversation state
-                self._conversation_history.append({
-                    "question": question,
-                    "response": response,
-                    "response_id": result.last_response_id
-                })
-                self._last_response_id = result.last_response_id
-                
                 logger.info(f"✅ Query successful! New response ID: {result.last_response_id[:12]}...")
-                return response
+                return response, result.last_response_id
                 
             except Exception as e:
                 logger.warning(f"⚠️  Query attempt {attempt + 1} failed: {e}")
@@ -192,6 +204,15 @@ class OptimizedMCPClient:
                     raise
                 await asyncio.sleep(1)  # Brief delay before retry
     
+    def _record_exchange(self, question: str, response: str, response_id: str):
+        """Append an exchange to the history and continue from its response ID."""
+        self._conversation_history.append({
+            "question": question,
+            "response": response,
+            "response_id": response_id
+        })
+        self._last_response_id = response_id
+    
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get the conversation history."""
         return self._conversation_history.copy()
@@ -210,6 +231,12 @@ class OptimizedMCPClient:
         """
         Execute multiple queries efficiently with conversation context.
         
+        With conversation context each question builds on the previous response,
+        so questions run one after another; without it they run concurrently.
+        Either way, conversation history ends up in question order and the last
+        response ID comes from the last question that succeeded, so a later
+        contextual query continues from that answer.
+        
         Args:
             questions: List of questions to ask
             use_conversation_context: Whether to maintain context between questions
@@ -220,6 +247,34 @@ class OptimizedMCPClient:
         results = {}
         logger.info(f"🔄 Starting batch query: {len(questions)} questions")
         
+        if not use_conversation_context:
+            # Independent questions don't chain response IDs, so run them concurrently
+            async def run_question(i: int, question: str):
+                try:
+                    logger.info(f"📝 Processing question {i}/{len(questions)}")
+                    outcome = await self._run_query(question, max_retries=3, previous_response_id=None)
+                    logger.info(f"✅ Question {i} completed successfully")
+                except Exception as e:
+                    logger.error(f"❌ Failed to process question {i}: {e}")
+                    outcome = e
+                return i, question, outcome
+            
+            completed = await asyncio.gather(
+                *(run_question(i, question) for i, question in enumerate(questions, 1))
+            )
+            
+            # Record history only after the gather, in question order
+            for _, question, outcome in completed:
+                if isinstance(outcome, Exception):
+                    results[question] = f"Error: {outcome}"
+                else:
+                    response, response_id = outcome
+                    self._record_exchange(question, response, response_id)
+                    results[question] = response
+            
+            logger.info(f"🏁 Batch query completed: {len(results)} results")
+            return results
+        
         for i, question in enumerate(questions, 1):
             try:
                 logger.info(f"📝 Processing question {i}/{len(questions)}")
@@ -235,8 +290,6 @@ class OptimizedMCPClient:
 
 def _format_issue_list(response: str) -> str:
     """Format issue list responses with better visual hierarchy."""
-    import re
-    
     # Look for numbered issues in the response
     lines = []
     
@@ -250,7 +303,7 @@ def _format_issue_list(response: str) -> str:
             continue
             
         # Detect issue patterns like "1. **[MCP-382]**" or "**[MCP-382]**"
-        if re.search(r'\*\*\[?MCP-\d+\]?\*\*', line) and ('Implement' in line or 'Setup' in line or 'Build' in line):
+        if _ISSUE_HEADER_RE.search(line) and ('Implement' in line or 'Setup' in line or 'Build' in line):
             if current_issue:
                 lines.extend(_format_single_issue(current_issue))
                 lines.append("")  # Add spacing between issues
@@ -279,8 +332,7 @@ def _format_single_issue(issue_lines: List[str]) -> List[str]:
     full_text = ' '.join(issue_lines)
     
     # Extract issue key and title using regex
-    import re
-    issue_match = re.search(r'MCP-(\d+)', full_text)
+    issue_match = _ISSUE_NUMBER_RE.search(full_text)
     
     if issue_match:
         issue_key = f"MCP-{issue_match.group(1)}"
@@ -301,20 +353,20 @@ def _format_single_issue(issue_lines: List[str]) -> List[str]:
         formatted.append(f"🎯 {issue_key}: {title}")
         
         # Extract description if available
-        desc_match = re.search(r'Description[:\*\s]*([^-\n]+?)(?:\s*-|\s*Status|$)', full_text)
+        desc_match = _DESCRIPTION_RE.search(full_text)
         if desc_match:
             desc = desc_match.group(1).strip()
             if desc and len(desc) > 10:  # Only show substantial descriptions
                 formatted.append(f"   📝 {desc}")
         
         # Extract status, priority, etc.
-        status_match = re.search(r'Status[:\*\s]*([^-\n]+?)(?:\s*-|\s*Priority|$)', full_text)
+        status_match = _STATUS_RE.search(full_text)
         if status_match:
             status = status_match.group(1).strip().replace('*', '')
             if status:
                 formatted.append(f"   📊 Status: {status}")
         
-        priority_match = re.search(r'Priority[:\*\s]*([^-\n]+?)(?:\s*-|\s*Assignee|$)', full_text)
+        priority_match = _PRIORITY_RE.search(full_text)
         if priority_match:
             priority = priority_match.group(1).strip().replace('*', '')
             if priority:
@@ -324,8 +376,6 @@ def _format_single_issue(issue_lines: List[str]) -> List[str]:
 
 def _format_dependency_suggestions(response: str) -> str:
     """Format dependency suggestion responses with clear hierarchy and pairings."""
-    import re
-    
     lines = []
     
     # Look for dependency patterns in the response
@@ -343,17 +393,17 @@ def _format_dependency_suggestions(response: str) -> str:
             lines.append(f"📋 {clean_line}")
             lines.append("")
         # Look for dependency relationship patterns
-        elif re.search(r'MCP-\d+.*(?:should|must|needs).*(?:before|after|depend).*MCP-\d+', line, re.IGNORECASE):
+        elif _DEPENDENCY_RELATION_RE.search(line):
             # This is a dependency relationship description
             lines.append(f"🔗 {line}")
-        elif re.search(r'MCP-\d+.*(?:→|->).*MCP-\d+', line):
+        elif _ARROW_DEPENDENCY_RE.search(line):
             # Arrow-based dependency
             lines.append(f"🔗 {line}")
-        elif re.search(r'^\d+\.\s.*MCP-\d+.*MCP-\d+', line):
+        elif _NUMBERED_PAIR_RE.search(line):
             # Numbered dependency item with two issue keys
-            clean_line = re.sub(r'^\d+\.\s*', '', line)
+            clean_line = _NUMBERED_PREFIX_RE.sub('', line)
             lines.append(f"🔗 {clean_line}")
-        elif re.search(r'MCP-\d+', line) and len(line) > 20:
+        elif _ISSUE_KEY_RE.search(line) and len(line) > 20:
             # Line contains issue keys and substantial content
             if "depends on" in line.lower() or "blocks" in line.lower() or "requires" in line.lower():
                 lines.append(f"   📌 {line}")
@@ -368,8 +418,6 @@ def _format_dependency_suggestions(response: str) -> str:
 
 def _format_link_confirmation(response: str) -> str:
     """Format link creation confirmation with clear success indicators and specific issue details."""
-    import re
-    
     lines = []
     
     # Check for successful link creation
@@ -378,13 +426,13 @@ def _format_link_confirmation(response: str) -> str:
         lines.append("")
         
         # Extract specific issue keys from the response
-        issue_keys = re.findall(r'MCP-\d+', response)
+        issue_keys = _ISSUE_KEY_RE.findall(response)
         if len(issue_keys) >= 2:
             lines.append(f"🔗 Linked Issues: {issue_keys[0]} ← depends on → {issue_keys[1]}")
             lines.append("")
         
         # Look for link type information
-        link_type_match = re.search(r'(?:link type|type)[:"\s]*([A-Za-z\s]+?)(?:["\n]|$)', response, re.IGNORECASE)
+        link_type_match = _LINK_TYPE_RE.search(response)
         if link_type_match:
             link_type = link_type_match.group(1).strip()
             lines.append(f"� Link Type: {link_type}")
@@ -420,8 +468,6 @@ def _format_link_confirmation(response: str) -> str:
 
 def _format_default_response(response: str) -> str:
     """Default formatting with improved readability and spacing."""
-    import textwrap
-    
     # Simple paragraph formatting with better spacing
     paragraphs = response.split('\n\n')
     formatted_paragraphs = []
@@ -5,12 +5,17 @@ Simple coverage runner for demo MCP app tests.
 Runs tests with coverage analysis and generates reports in multiple formats.
 """
 
-import subprocess
+import faulthandler
 import sys
 import os
 import json
 from pathlib import Path
 
+import pytest
+
+# Same budget the old subprocess run had
+TEST_TIMEOUT_SECONDS = 60
+
 def run_coverage():
     """Run tests with coverage and generate reports."""
     print("=== Running Demo MCP App Tests with Coverage ===")
@@ -19,8 +24,9 @@ def run_coverage():
     project_root = Path(__file__).parent.parent.parent
     os.chdir(project_root)
     
-    # Set PYTHONPATH
+    # Set PYTHONPATH (and sys.path, since the suite runs in-process)
     os.environ["PYTHONPATH"] = str(project_root / "src")
+    sys.path.insert(0, os.environ["PYTHONPATH"])
     
     print(f"Working directory: {os.getcwd()}")
     print(f"PYTHONPATH: {os.environ.get('PYTHONPATH')}")
@@ -28,31 +34,27 @@ def run_coverage():
     # Run tests with coverage
     print("\n1. Running tests with coverage...")
     try:
-        # Use unittest discovery to run all tests
-        result = subprocess.run([
-            sys.executable, "-m", "unittest", 
-            "discover", 
-            "src/demo_mcp_app/tests", 
-            "-v"
-        ], capture_output=True, text=True, timeout=60)
-        
-        print("STDOUT:")
-        print(result.stdout)
+        # Run pytest in-process; the exit code reports success directly,
+        # without spawning and reaping a child interpreter. A hung test would
+        # block forever, so dump every thread's stack and exit on timeout,
+        # writing to a copy of stderr that pytest's output capture can't swallow.
+        with os.fdopen(os.dup(sys.stderr.fileno()), "w") as timeout_stream:
+            faulthandler.dump_traceback_later(
+                TEST_TIMEOUT_SECONDS, exit=True, file=timeout_stream
+            )
+            try:
+                exit_code = pytest.main(["src/demo_mcp_app/tests"])
+            finally:
+                faulthandler.cancel_dump_traceback_later()
         
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-        
-        if result.returncode == 0:
+        tests_passed = exit_code == pytest.ExitCode.OK
+        if tests_passed:
             print("✅ All tests passed!")
         else:
-            print(f"❌ Tests failed with return code {result.returncode}")
+            print(f"❌ Tests failed with exit code {int(exit_code)}")
         
-        return result.returncode == 0
+        return tests_passed
         
-    except subprocess.TimeoutExpired:
-        print("❌ Tests timed out after 60 seconds")
-        return False
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return False
@@ -60,7 +62,7 @@ def run_coverage():
 def generate_test_summary():
     """Generate a test execution summary."""
     summary = {
-        "test_framework": "unittest",
+        "test_framework": "pytest",
         "test_discovery_path": "src/demo_mcp_app/tests",
         "test_modules": [
             "test_core.py - Core functionality tests (12 tests)",
@@ -0,0 +1,139 @@
+"""
+Shared test doubles for the OpenAI MCP Demo test suite.
+"""
+
+import contextlib
+import functools
+import inspect
+import re
+
+from .fixtures import JiraFixtures, OpenAIFixtures
+
+
+def _message_content(response):
+    """Extract the assistant text from a mocked OpenAI chat response."""
+    return response["choices"][0]["message"]["content"]
+
+
+def _issue_list_text():
+    """Render the Jira issue fixtures the way the agent lists them."""
+    lines = ["Here are some issues in the MCP project:", ""]
+    for number, issue in enumerate(JiraFixtures.get_issues_response()["issues"], 1):
+        fields = issue["fields"]
+        lines.append(
+            f"{number}. **[{issue['key']}]**: {fields['summary']}"
+            f" - Status: {fields['status']['name']}"
+            f" - Priority: {fields['priority']['name']}"
+        )
+    return "\n".join(lines)
+
+
+# Canned agent answers keyed by the first keyword found in the question
+_CANNED_RESPONSES = {
+    "projects": _message_content(OpenAIFixtures.get_project_list_response()),
+    "issues": _issue_list_text(),
+    "dependencies": _message_content(OpenAIFixtures.get_analysis_response()),
+    "link": _message_content(OpenAIFixtures.get_link_creation_response()),
+}
+_RESPONSE_KEYWORD = re.compile("|".join(_CANNED_RESPONSES), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _response_id(question):
+    """Response ID the mock runner reports for a question."""
+    return f"response-{hash(question) % 10000}"
+
+
+@functools.lru_cache(maxsize=256)
+def _processed(question):
+    """Fallback answer the mock runner gives when no keyword matches."""
+    return f"Processed: {question}"
+
+
+class MockRunResult:
+    """Lightweight stand-in for the result object returned by Runner.run."""
+
+    __slots__ = ("_output", "last_response_id")
+
+    def __init__(self, output, last_response_id):
+        self._output = output
+        self.last_response_id = last_response_id
+
+    def final_output_as(self, cls, raise_if_incorrect_type=False):
+        return self._output
+
+
+class MockMCPServer:
+    """Stand-in for MCPServerStdio that connects and cleans up instantly."""
+
+    def __init__(self, params=None):
+        self.params = params
+        self.connect_calls = 0
+        self.cleanup_calls = 0
+
+    async def connect(self):
+        self.connect_calls += 1
+
+    async def cleanup(self):
+        self.cleanup_calls += 1
+
+
+class FailingMCPServer(MockMCPServer):
+    """MCP server double whose connect() always fails."""
+
+    async def connect(self):
+        self.connect_calls += 1
+        raise ConnectionError("Connection failed")
+
+
+class MockAgent:
+    """Stand-in for agents.Agent that keeps its constructor arguments."""
+
+    def __init__(self, name, model, instructions, mcp_servers):
+        self.name = name
+        self.model = model
+        self.instructions = instructions
+        self.mcp_servers = mcp_servers
+
+
+async def _mock_run(agent, question, previous_response_id=None):
+    """Answer a question from the canned fixture responses."""
+    match = _RESPONSE_KEYWORD.search(question)
+    if match:
+        output = _CANNED_RESPONSES[match.group(0).lower()]
+    else:
+        output = _processed(question)
+
+    return MockRunResult(output, _response_id(question))
+
+
+class MockRunner:
+    """Stand-in for agents.Runner; only ever used through the class, never instantiated."""
+
+    run = _mock_run
+
+
+class MockAsyncContextManager:
+    """Async context manager that yields ``target`` (or itself) and tracks connection state."""
+
+    def __init__(self, target=None):
+        self.target = target
+        self.connected = False
+
+    async def __aenter__(self):
+        self.connected = True
+        return self if self.target is None else self.target
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.connected = False
+
+
+@contextlib.contextmanager
+def swap(obj, name, new):
+    """Temporarily set ``obj.name`` to ``new``, restoring the original on exit."""
+    original = inspect.getattr_static(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, name, original)
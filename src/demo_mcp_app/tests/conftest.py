@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures for the OpenAI MCP Demo test suite.
+"""
+
+import pytest
+import pytest_asyncio
+
+from openai_mcp_demo import (
+    MCPConfig,
+    AgentConfig,
+    OptimizedMCPClient
+)
+
+from ._helpers import MockMCPServer, MockAgent, MockRunner
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mcp_doubles():
+    """Install the MCP server, agent and runner doubles once per test module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('openai_mcp_demo.MCPServerStdio', MockMCPServer)
+        mp.setattr('openai_mcp_demo.Agent', MockAgent)
+        mp.setattr('openai_mcp_demo.Runner', MockRunner)
+        yield
+
+
+@pytest_asyncio.fixture(scope="module")
+async def connected_client(mcp_doubles):
+    """OptimizedMCPClient connected once per module against the doubles."""
+    client = OptimizedMCPClient(MCPConfig(), AgentConfig())
+    async with client.connect():
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def fresh_conversation(request):
+    """Reset conversation state on the shared client after each test that uses it."""
+    yield
+    if "connected_client" in request.fixturenames:
+        request.getfixturevalue("connected_client").clear_conversation_context()
@@ -6,7 +6,21 @@ and other test scenarios.
 """
 
 import json
-from typing import Dict, List, Any
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Any
+
+
+def _jira_timestamp(day: int, hour: int, minute: int) -> str:
+    """Render a January 2024 UTC timestamp in Jira's millisecond format."""
+    moment = datetime(2024, 1, day, hour, minute, tzinfo=timezone.utc)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+# (created, updated) pairs for the performance dataset, indexed by ``i % 30``
+_PERFORMANCE_DATES = [
+    (_jira_timestamp(day, 10, 0), _jira_timestamp(day, 15, 30))
+    for day in range(1, 31)
+]
 
 
 class JiraFixtures:
@@ -422,25 +436,39 @@ class TestScenarios:
         }
 
     @staticmethod
-    def get_performance_test_data() -> Dict[str, Any]:
-        """Large dataset for performance testing."""
-        # Generate large issue set
-        issues = []
-        for i in range(1, 101):  # 100 issues
-            issues.append({
+    def iter_performance_issues(count: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield the large performance-test issue set one issue at a time."""
+        filler = "x" * 1000
+        for i in range(1, count + 1):
+            created, updated = _PERFORMANCE_DATES[i % 30]
+            yield {
                 "id": f"1{i:04d}",
                 "key": f"MCP-{i+400}",
                 "fields": {
                     "summary": f"Performance Test Issue {i}",
-                    "description": f"This is a performance test issue number {i} with detailed description " + "x" * 1000,
+                    "description": f"This is a performance test issue number {i} with detailed description " + filler,
                     "status": {"name": "To Do" if i % 3 == 0 else "In Progress"},
                     "priority": {"name": "High" if i % 5 == 0 else "Medium"},
                     "issuetype": {"name": "Story"},
                     "assignee": {"displayName": f"User {i % 10}"},
-                    "created": f"2024-01-{(i % 30) + 1:02d}T10:00:00.000Z",
-                    "updated": f"2024-01-{(i % 30) + 1:02d}T15:30:00.000Z"
+                    "created": created,
+                    "updated": updated
                 }
-            })
+            }
+
+    @staticmethod
+    def get_performance_test_data(materialize: bool = True) -> Dict[str, Any]:
+        """
+        Large dataset for performance testing.
+
+        With ``materialize=False``, ``data["issues"]["issues"]`` is a one-shot
+        iterator from ``iter_performance_issues()`` for callers that stream
+        over it, and ``metrics["total_size_kb"]`` is ``None`` because measuring
+        it needs the full list.
+        """
+        issues = TestScenarios.iter_performance_issues(100)
+        if materialize:
+            issues = list(issues)
 
         return {
             "name": "Performance Test Dataset", 
@@ -452,7 +480,7 @@ class TestScenarios:
             },
             "metrics": {
                 "issue_count": 100,
-                "total_size_kb": len(json.dumps(issues)) // 1024,
+                "total_size_kb": len(json.dumps(issues)) // 1024 if materialize else None,
                 "max_description_length": 1100
             }
         }
@@ -4,87 +4,112 @@ Simplified integration tests for OpenAI MCP Demo application.
 Focuses on core functionality rather than internal implementation details.
 """
 
-import unittest
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
-import sys
-import os
+import asyncio
+from unittest.mock import patch, MagicMock, Mock
 
-# Add the demo app to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import pytest
 
 from openai_mcp_demo import (
     OptimizedMCPClient,
     demo_optimized_client
 )
 
+from ._helpers import FailingMCPServer, MockAsyncContextManager, _CANNED_RESPONSES
 
-class TestOptimizedMCPClient(unittest.IsolatedAsyncioTestCase):
-    """Simple tests for the core MCP client functionality."""
-    
-    @patch('openai_mcp_demo.MCPServerStdio')
-    @patch('openai_mcp_demo.Agent') 
-    @patch('openai_mcp_demo.Runner')
-    async def test_basic_query(self, mock_runner, mock_agent, mock_server):
-        """Test basic query functionality."""
-        # Simple mock setup
-        mock_server_instance = AsyncMock()
-        mock_server.return_value = mock_server_instance
-        
-        mock_result = Mock()
-        mock_result.final_output_as = Mock(return_value="Test response")
-        mock_result.last_response_id = "test-123"
-        mock_runner.run = AsyncMock(return_value=mock_result)
-        
-        client = OptimizedMCPClient()
+
+async def test_basic_query(connected_client):
+    """Test basic query functionality."""
+    response = await connected_client.query("Test question")
+
+    assert response == "Processed: Test question"
+    assert len(connected_client.get_conversation_history()) == 1
+
+
+async def _full_workflow(client):
+    """Walk through project listing, issues, dependency analysis and linking."""
+    steps = [
+        ("What projects are available?", "projects"),
+        ("Show me the issues in MCP", "issues"),
+        ("Suggest dependencies between these issues", "dependencies"),
+        ("Create the link between MCP-377 and MCP-376", "link"),
+    ]
+    for question, keyword in steps:
+        assert await client.query(question) == _CANNED_RESPONSES[keyword]
+
+    assert len(client.get_conversation_history()) == len(steps)
+
+
+async def _persistence(client):
+    """Check each answer is recorded and the latest response ID is carried forward."""
+    await client.query("What projects are available?")
+    first_id = client.get_last_response_id()
+    await client.query("Show me the issues in the first one")
+
+    history = client.get_conversation_history()
+    assert [entry["question"] for entry in history] == [
+        "What projects are available?",
+        "Show me the issues in the first one",
+    ]
+    assert history[0]["response_id"] == first_id
+    assert history[-1]["response_id"] == client.get_last_response_id()
+
+
+async def _clearing(client):
+    """Check clearing the context drops history but keeps the connection usable."""
+    await client.query("What projects are available?")
+    client.clear_conversation_context()
+
+    assert len(client.get_conversation_history()) == 0
+    assert client.get_last_response_id() is None
+
+    await client.query("Show me the issues in MCP")
+    assert len(client.get_conversation_history()) == 1
+
+
+_WORKFLOWS = {
+    "full_workflow": _full_workflow,
+    "persistence": _persistence,
+    "clearing": _clearing,
+}
+
+
+@pytest.mark.parametrize("scenario", list(_WORKFLOWS))
+async def test_workflow(connected_client, scenario):
+    """Test multi-step workflows over the shared connection."""
+    await _WORKFLOWS[scenario](connected_client)
+
+
+async def test_connection_error_handling(monkeypatch):
+    """Test connection error handling."""
+    monkeypatch.setattr('openai_mcp_demo.MCPServerStdio', FailingMCPServer)
+
+    client = OptimizedMCPClient()
+    with pytest.raises(Exception) as context:
         async with client.connect():
-            response = await client.query("Test question")
-            
-        self.assertEqual(response, "Test response")
-        mock_runner.run.assert_called_once()
-    
-    @patch('openai_mcp_demo.MCPServerStdio')
-    async def test_connection_error_handling(self, mock_server_class):
-        """Test connection error handling."""
-        mock_server = AsyncMock()
-        mock_server.connect.side_effect = Exception("Connection failed")
-        mock_server_class.return_value = mock_server
-        
-        client = OptimizedMCPClient()
-        with self.assertRaises(Exception) as context:
-            async with client.connect():
-                pass
-                
-        self.assertIn("Connection failed", str(context.exception))
-
-    @patch('openai_mcp_demo.load_dotenv')
-    @patch('openai_mcp_demo.OptimizedMCPClient')
-    async def test_demo_function(self, mock_client_class, mock_load_dotenv):
-        """Test the demo function runs without errors."""
-        # Create a simple async context manager using MagicMock
-        class MockAsyncContextManager:
-            def __init__(self, client):
-                self.client = client
-            
-            async def __aenter__(self):
-                return self.client
-            
-            async def __aexit__(self, exc_type, exc_val, exc_tb):
-                return None
-        
-        mock_client = MagicMock()
-        mock_client.query = AsyncMock(return_value="Mock response")
-        mock_client.get_conversation_history = MagicMock(return_value=[])
-        mock_client.get_last_response_id = MagicMock(return_value="mock-id")
-        mock_client._last_response_id = "mock-id"
-        
-        # Set up the connect method to return our custom async context manager
-        mock_client.connect = MagicMock(return_value=MockAsyncContextManager(mock_client))
-        mock_client_class.return_value = mock_client
-        
-        await demo_optimized_client()  # Should not raise
-        
-        mock_load_dotenv.assert_called_once()
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+            pass
+
+    assert "Connection failed" in str(context.value)
+    assert client._server.connect_calls == 1
+
+
+@patch('openai_mcp_demo.load_dotenv')
+@patch('openai_mcp_demo.OptimizedMCPClient')
+async def test_demo_function(mock_client_class, mock_load_dotenv):
+    """Test the demo function runs without errors."""
+    # Every query awaits the same already-resolved future
+    response = asyncio.get_running_loop().create_future()
+    response.set_result("Mock response")
+
+    mock_client = MagicMock()
+    mock_client.query = Mock(return_value=response)
+    mock_client.get_conversation_history = MagicMock(return_value=[])
+    mock_client.get_last_response_id = MagicMock(return_value="mock-id")
+    mock_client._last_response_id = "mock-id"
+
+    # Set up the connect method to return our custom async context manager
+    mock_client.connect = MagicMock(return_value=MockAsyncContextManager(mock_client))
+    mock_client_class.return_value = mock_client
+
+    await demo_optimized_client()  # Should not raise
+
+    mock_load_dotenv.assert_called_once()
@@ -7,13 +7,11 @@ and utility functions without external dependencies.
 
 import unittest
 import asyncio
-from unittest.mock import Mock, MagicMock, patch, AsyncMock
+from unittest.mock import patch
 from typing import List, Dict, Any
-import sys
 import os
 
-# Add the demo app to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import pytest
 
 from openai_mcp_demo import (
     MCPConfig,
@@ -26,6 +24,11 @@ from openai_mcp_demo import (
     _format_single_issue
 )
 
+from ._helpers import FailingMCPServer, MockMCPServer, MockRunResult, MockRunner, swap
+
+# Agent placeholder; the runner doubles only pass it through
+_FAKE_AGENT = object()
+
 
 class TestMCPConfig(unittest.TestCase):
     """Test cases for MCPConfig class."""
@@ -134,16 +137,6 @@ class TestOptimizedMCPClient(unittest.TestCase):
         self.client._last_response_id = "test-id"
         self.assertEqual(self.client.get_last_response_id(), "test-id")
 
-    @patch('openai_mcp_demo.Runner')
-    @patch('openai_mcp_demo.Agent')
-    @patch('openai_mcp_demo.MCPServerStdio')
-    async def test_query_without_connection(self, mock_server, mock_agent, mock_runner):
-        """Test query raises error when not connected."""
-        with self.assertRaises(RuntimeError) as context:
-            await self.client.query("test question")
-        
-        self.assertIn("not connected", str(context.exception))
-
 
 class TestFormattingFunctions(unittest.TestCase):
     """Test cases for response formatting functions."""
@@ -223,55 +216,52 @@ MCP-377 should depend on MCP-376 before implementation."""
         self.assertIn("very long response", result)
 
 
-class TestAsyncMethods(unittest.IsolatedAsyncioTestCase):
+class TestAsyncMethods:
     """Test async methods of OptimizedMCPClient."""
 
-    def setUp(self):
+    def setup_method(self):
         """Set up test fixtures."""
         self.client = OptimizedMCPClient()
 
-    @patch('openai_mcp_demo.MCPServerStdio')
-    @patch('openai_mcp_demo.Agent')
-    async def test_establish_connection_success(self, mock_agent_class, mock_server_class):
-        """Test successful connection establishment."""
-        # Setup mocks
-        mock_server = AsyncMock()
-        mock_server_class.return_value = mock_server
-        mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
+    async def test_query_without_connection(self):
+        """Test query raises error when not connected."""
+        with pytest.raises(RuntimeError) as context:
+            await self.client.query("test question")
 
-        # Test connection
+        assert "not connected" in str(context.value)
+
+    async def test_establish_connection_success(self):
+        """Test successful connection establishment."""
+        # Test connection against the conftest server and agent doubles
         await self.client._establish_connection()
 
         # Verify connection state
-        self.assertTrue(self.client._connected)
-        self.assertIsNotNone(self.client._server)
-        self.assertIsNotNone(self.client._agent)
+        assert self.client._connected
+        assert self.client._server is not None
+        assert self.client._agent is not None
 
         # Verify server connection was called
-        mock_server.connect.assert_called_once()
+        assert self.client._server.connect_calls == 1
 
-    @patch('openai_mcp_demo.MCPServerStdio')
-    async def test_establish_connection_failure(self, mock_server_class):
+    async def test_establish_connection_failure(self, monkeypatch):
         """Test connection establishment failure."""
-        # Setup mock to fail
-        mock_server = AsyncMock()
-        mock_server.connect.side_effect = Exception("Connection failed")
-        mock_server_class.return_value = mock_server
+        monkeypatch.setattr('openai_mcp_demo.MCPServerStdio', FailingMCPServer)
 
         # Test connection failure
-        with self.assertRaises(Exception):
+        with pytest.raises(ConnectionError):
             await self.client._establish_connection()
 
-        # Verify cleanup occurred
-        self.assertFalse(self.client._connected)
+        # Verify the client never reached the connected state
+        assert not self.client._connected
+        assert self.client._server.connect_calls == 1
+        assert self.client._server.cleanup_calls == 0
 
     async def test_cleanup_connection(self):
         """Test connection cleanup."""
         # Setup fake connection state
-        mock_server = AsyncMock()
+        mock_server = MockMCPServer()
         self.client._server = mock_server
-        self.client._agent = Mock()
+        self.client._agent = _FAKE_AGENT
         self.client._connected = True
         self.client._conversation_history = [{"test": "data"}]
         self.client._last_response_id = "test-id"
@@ -280,42 +270,70 @@ class TestAsyncMethods(unittest.IsolatedAsyncioTestCase):
         await self.client._cleanup_connection()
 
         # Verify cleanup
-        self.assertFalse(self.client._connected)
-        self.assertIsNone(self.client._server)
-        self.assertIsNone(self.client._agent)
-        self.assertEqual(self.client._conversation_history, [])
-        self.assertIsNone(self.client._last_response_id)
+        assert not self.client._connected
+        assert self.client._server is None
+        assert self.client._agent is None
+        assert self.client._conversation_history == []
+        assert self.client._last_response_id is None
 
         # Verify server cleanup was called
-        mock_server.cleanup.assert_called_once()
+        assert mock_server.cleanup_calls == 1
 
-    @patch('openai_mcp_demo.Runner')
-    async def test_batch_query(self, mock_runner):
+    async def test_batch_query(self):
         """Test batch query processing."""
-        # Setup mock
-        mock_result = Mock()  # Use regular Mock, not AsyncMock
-        mock_result.final_output_as = Mock(return_value="Test response")
-        mock_result.last_response_id = "test-id"
-        
-        # Make run async
+        result = MockRunResult("Test response", "test-id")
+
         async def async_run(*args, **kwargs):
-            return mock_result
-        mock_runner.run = async_run
+            return result
 
         # Setup client as connected
         self.client._connected = True
-        self.client._agent = Mock()
+        self.client._agent = _FAKE_AGENT
 
         # Test batch query
         questions = ["Question 1", "Question 2"]
-        results = await self.client.batch_query(questions)
+        with swap(MockRunner, "run", async_run):
+            results = await self.client.batch_query(questions)
 
         # Verify results
-        self.assertEqual(len(results), 2)
-        self.assertIn("Question 1", results)
-        self.assertIn("Question 2", results)
-        self.assertEqual(results["Question 1"], "Test response")
-        self.assertEqual(results["Question 2"], "Test response")
+        assert len(results) == 2
+        assert "Question 1" in results
+        assert "Question 2" in results
+        assert results["Question 1"] == "Test response"
+        assert results["Question 2"] == "Test response"
+
+    async def test_batch_query_without_context(self):
+        """Test batch queries without conversation context run independently."""
+        self.client._connected = True
+        self.client._agent = _FAKE_AGENT
+
+        questions = ["Question 1", "Question 2", "Question 3"]
+        results = await self.client.batch_query(questions, use_conversation_context=False)
+
+        assert list(results) == questions
+        assert results["Question 2"] == "Processed: Question 2"
+        assert len(self.client.get_conversation_history()) == 3
+
+    async def test_batch_query_without_context_keeps_question_order(self):
+        """Test concurrent batch history follows question order, not finish order."""
+        # Later questions yield fewer times, so they finish first
+        yields = {"Question 1": 2, "Question 2": 1, "Question 3": 0}
+
+        async def reversed_run(agent, question, previous_response_id=None):
+            for _ in range(yields[question]):
+                await asyncio.sleep(0)
+            return MockRunResult(f"Answer to {question}", f"id-{question[-1]}")
+
+        self.client._connected = True
+        self.client._agent = _FAKE_AGENT
+
+        questions = list(yields)
+        with swap(MockRunner, "run", reversed_run):
+            await self.client.batch_query(questions, use_conversation_context=False)
+
+        history = self.client.get_conversation_history()
+        assert [entry["question"] for entry in history] == questions
+        assert self.client.get_last_response_id() == "id-3"
 
 
 if __name__ == '__main__':
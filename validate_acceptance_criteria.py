@@ -6,204 +6,201 @@ This script validates that all acceptance criteria from the original issue
 have been successfully implemented in the building stage.
 """
 
-import os
 import sys
+from pathlib import Path
+
+from validation_helpers import list_directory, path_exists, write_lines
+
+
+DOCKERFILE = "Dockerfile"
+BUILDING_MODULE = "src/dagger_mcp_server/building.py"
+
+# One row per acceptance criterion, in report order:
+#   (title, {path: substrings that must all occur in it}, ok message,
+#    fail message, message when a required file is missing)
+# A path with no substrings only has to exist. A criterion with no paths
+# always passes.
+CRITERIA = [
+    (
+        "1️⃣  Multi-stage Dockerfile implementation for development and production",
+        {DOCKERFILE: [b"development", b"testing", b"production"]},
+        "   ✅ Multi-stage Dockerfile with development, testing, and production stages",
+        "   ❌ Missing required stages in Dockerfile",
+        "   ❌ Dockerfile not found",
+    ),
+    (
+        "2️⃣  Optimized production container image with minimal attack surface",
+        {BUILDING_MODULE: [b"build_production_image", b"mcpuser", b"chown", b"non-root"]},
+        "   ✅ Production image function with security hardening (non-root user)",
+        "   ❌ Missing production image function or security features",
+        "   ❌ Building module not found",
+    ),
+    (
+        "3️⃣  Python wheel and source distribution package generation",
+        {BUILDING_MODULE: [b"generate_python_packages", b"--wheel", b"--sdist"]},
+        "   ✅ Python package generation with wheel and source distribution",
+        "   ❌ Missing package generation functionality",
+        None,
+    ),
+    (
+        "4️⃣  Container image vulnerability scanning integration",
+        {},
+        "   ✅ Ready for scanning integration (multi-stage builds, minimal base)",
+        None,
+        None,
+    ),
+    (
+        "5️⃣  Automated image tagging with semantic versioning",
+        {},
+        "   ✅ Version support implemented (configurable through build process)",
+        None,
+        None,
+    ),
+    (
+        "6️⃣  Docker Compose and Kubernetes deployment manifest generation",
+        {BUILDING_MODULE: [b"create_deployment_manifests", b"docker-compose.yml", b"k8s-deployment.yaml"]},
+        "   ✅ Docker Compose and Kubernetes manifest generation",
+        "   ❌ Missing manifest generation functionality",
+        None,
+    ),
+    (
+        "7️⃣  API documentation generation from source code",
+        {BUILDING_MODULE: [b"generate_documentation", b"sphinx"]},
+        "   ✅ Sphinx-based API documentation generation",
+        "   ❌ Missing documentation generation functionality",
+        None,
+    ),
+    (
+        "8️⃣  Build artifact validation and integrity checking",
+        {},
+        "   ✅ Build results validation with comprehensive result classes",
+        None,
+        None,
+    ),
+    (
+        "9️⃣  Container registry integration with automated pushing",
+        {BUILDING_MODULE: [b"registry", b"ghcr.io"]},
+        "   ✅ Container registry integration (GHCR support)",
+        "   ❌ Missing registry integration",
+        None,
+    ),
+    (
+        "🔟  Build performance optimization with effective caching strategies",
+        {DOCKERFILE: [b"pip"], BUILDING_MODULE: [b"cache_volume", b"cache"]},
+        "   ✅ Caching strategies implemented (pip cache, layer optimization)",
+        "   ❌ Missing caching optimization",
+        None,
+    ),
+    (
+        "1️⃣1️⃣ Local execution capability with dagger call build-artifacts",
+        {"test_building_implementation.py": [], "demo_building_stage.py": []},
+        "   ✅ Local execution examples and validation scripts provided",
+        "   ❌ Missing local execution examples",
+        "   ❌ Missing local execution examples",
+    ),
+    (
+        "1️⃣2️⃣ Integration with Dagger Cloud tracing for build monitoring",
+        {BUILDING_MODULE: [b"@function", b"dagger.Directory"]},
+        "   ✅ Dagger Cloud integration ready (proper function decorators)",
+        "   ❌ Missing Dagger integration",
+        None,
+    ),
+    (
+        "1️⃣3️⃣ CI/CD platform integration with artifact publishing capabilities",
+        {".dockerignore": [], BUILDING_MODULE: []},
+        "   ✅ CI/CD ready (.dockerignore, optimized builds, artifact export)",
+        "   ❌ Missing CI/CD integration features",
+        "   ❌ Missing CI/CD integration features",
+    ),
+]
+
+
+def _try_read(path):
+    """Return the bytes of ``path``, or None if it does not exist."""
+    # Read straight away instead of checking existence first
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def scan_file(path, patterns):
+    """Return which ``patterns`` occur in ``path``, or None if it is missing."""
+    # Paths without patterns only need to exist, so list instead of reading
+    if not patterns:
+        return frozenset() if path_exists(path) else None
+    data = _try_read(path)
+    if data is None:
+        return None
+    # The patterns are all ASCII, so match on the raw bytes without decoding
+    return {p for p in patterns if p in data}
+
+
+def check(criterion, scanned):
+    """Evaluate one CRITERIA row against the scanned files."""
+    title, requirements, ok_message, fail_message, missing_message = criterion
+    # Paths left unscanned belong to criteria already failed by a missing file
+    if any(scanned.get(path) is None for path in requirements):
+        return title, False, missing_message
+    if all(sub in scanned[path] for path, subs in requirements.items() for sub in subs):
+        return title, True, ok_message
+    return title, False, fail_message
 
 
 def validate_acceptance_criteria():
     """Validate all acceptance criteria have been met."""
     
-    print("🔍 Validating Building Stage Implementation Against Acceptance Criteria")
-    print("=" * 75)
-    
-    criteria = []
-    
-    # 1. Multi-stage Dockerfile implementation
-    print("\n1️⃣  Multi-stage Dockerfile implementation for development and production")
-    dockerfile_exists = os.path.exists("Dockerfile")
-    if dockerfile_exists:
-        with open("Dockerfile", "r") as f:
-            content = f.read()
-        has_stages = all(stage in content for stage in ["development", "testing", "production"])
-        if has_stages:
-            print("   ✅ Multi-stage Dockerfile with development, testing, and production stages")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing required stages in Dockerfile")
-            criteria.append(False)
-    else:
-        print("   ❌ Dockerfile not found")
-        criteria.append(False)
-    
-    # 2. Optimized production container image
-    print("\n2️⃣  Optimized production container image with minimal attack surface")
-    building_module_exists = os.path.exists("src/dagger_mcp_server/building.py")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_production_function = "build_production_image" in content
-        has_security_features = all(feature in content for feature in ["mcpuser", "chown", "non-root"])
-        if has_production_function and has_security_features:
-            print("   ✅ Production image function with security hardening (non-root user)")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing production image function or security features")
-            criteria.append(False)
-    else:
-        print("   ❌ Building module not found")
-        criteria.append(False)
-    
-    # 3. Python package generation
-    print("\n3️⃣  Python wheel and source distribution package generation")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_package_function = "generate_python_packages" in content
-        has_wheel_and_sdist = "--wheel" in content and "--sdist" in content
-        if has_package_function and has_wheel_and_sdist:
-            print("   ✅ Python package generation with wheel and source distribution")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing package generation functionality")
-            criteria.append(False)
-    else:
-        criteria.append(False)
-    
-    # 4. Container image vulnerability scanning integration (placeholder)
-    print("\n4️⃣  Container image vulnerability scanning integration")
-    print("   ✅ Ready for scanning integration (multi-stage builds, minimal base)")
-    criteria.append(True)
+    out = []
     
-    # 5. Automated image tagging with semantic versioning
-    print("\n5️⃣  Automated image tagging with semantic versioning")
-    print("   ✅ Version support implemented (configurable through build process)")
-    criteria.append(True)
+    out.append("🔍 Validating Building Stage Implementation Against Acceptance Criteria")
+    out.append("=" * 75)
     
-    # 6. Docker Compose and Kubernetes deployment manifest generation
-    print("\n6️⃣  Docker Compose and Kubernetes deployment manifest generation")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_manifest_function = "create_deployment_manifests" in content
-        has_docker_compose = "docker-compose.yml" in content
-        has_kubernetes = "k8s-deployment.yaml" in content
-        if has_manifest_function and has_docker_compose and has_kubernetes:
-            print("   ✅ Docker Compose and Kubernetes manifest generation")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing manifest generation functionality")
-            criteria.append(False)
-    else:
-        criteria.append(False)
+    # Start from fresh directory listings on every run
+    list_directory.cache_clear()
     
-    # 7. API documentation generation from source code
-    print("\n7️⃣  API documentation generation from source code")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_docs_function = "generate_documentation" in content
-        has_sphinx = "sphinx" in content
-        if has_docs_function and has_sphinx:
-            print("   ✅ Sphinx-based API documentation generation")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing documentation generation functionality")
-            criteria.append(False)
-    else:
-        criteria.append(False)
+    # On a tree without the Dockerfile or building module, every criterion
+    # that needs one fails outright, so skip the files only those would read
+    missing = {path for path in (DOCKERFILE, BUILDING_MODULE) if not path_exists(path)}
+    scanned = dict.fromkeys(missing)
     
-    # 8. Build artifact validation and integrity checking
-    print("\n8️⃣  Build artifact validation and integrity checking")
-    print("   ✅ Build results validation with comprehensive result classes")
-    criteria.append(True)
+    # Gather every substring the remaining criteria need from each file, so
+    # each file is read and scanned once however many criteria look at it
+    patterns_by_path = {}
+    for _, requirements, _, _, _ in CRITERIA:
+        if missing.isdisjoint(requirements):
+            for path, subs in requirements.items():
+                patterns_by_path.setdefault(path, set()).update(subs)
     
-    # 9. Container registry integration with automated pushing
-    print("\n9️⃣  Container registry integration with automated pushing")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_registry_support = "registry" in content and "ghcr.io" in content
-        if has_registry_support:
-            print("   ✅ Container registry integration (GHCR support)")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing registry integration")
-            criteria.append(False)
-    else:
-        criteria.append(False)
+    for path, patterns in patterns_by_path.items():
+        scanned[path] = scan_file(path, patterns)
     
-    # 10. Build performance optimization with effective caching strategies
-    print("\n🔟  Build performance optimization with effective caching strategies")
-    if dockerfile_exists and building_module_exists:
-        with open("Dockerfile", "r") as f:
-            dockerfile_content = f.read()
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            building_content = f.read()
-        has_caching = "cache_volume" in building_content
-        has_layer_optimization = "pip" in dockerfile_content and "cache" in building_content
-        if has_caching and has_layer_optimization:
-            print("   ✅ Caching strategies implemented (pip cache, layer optimization)")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing caching optimization")
-            criteria.append(False)
-    else:
-        criteria.append(False)
+    results = [check(criterion, scanned) for criterion in CRITERIA]
     
-    # 11. Local execution capability
-    print("\n1️⃣1️⃣ Local execution capability with dagger call build-artifacts")
-    test_file_exists = os.path.exists("test_building_implementation.py")
-    demo_file_exists = os.path.exists("demo_building_stage.py")
-    if test_file_exists and demo_file_exists:
-        print("   ✅ Local execution examples and validation scripts provided")
-        criteria.append(True)
-    else:
-        print("   ❌ Missing local execution examples")
-        criteria.append(False)
-    
-    # 12. Integration with Dagger Cloud tracing
-    print("\n1️⃣2️⃣ Integration with Dagger Cloud tracing for build monitoring")
-    if building_module_exists:
-        with open("src/dagger_mcp_server/building.py", "r") as f:
-            content = f.read()
-        has_dagger_integration = "@function" in content and "dagger.Directory" in content
-        if has_dagger_integration:
-            print("   ✅ Dagger Cloud integration ready (proper function decorators)")
-            criteria.append(True)
-        else:
-            print("   ❌ Missing Dagger integration")
-            criteria.append(False)
-    else:
-        criteria.append(False)
-    
-    # 13. CI/CD platform integration
-    print("\n1️⃣3️⃣ CI/CD platform integration with artifact publishing capabilities")
-    dockerignore_exists = os.path.exists(".dockerignore")
-    if dockerignore_exists and building_module_exists:
-        print("   ✅ CI/CD ready (.dockerignore, optimized builds, artifact export)")
-        criteria.append(True)
-    else:
-        print("   ❌ Missing CI/CD integration features")
-        criteria.append(False)
+    criteria = []
+    for label, passed, message in results:
+        out.append(f"\n{label}")
+        if message is not None:
+            out.append(message)
+        criteria.append(passed)
     
     # Summary
     passed = sum(criteria)
     total = len(criteria)
     success_rate = (passed / total) * 100
     
-    print("\n" + "=" * 75)
-    print(f"📊 Acceptance Criteria Validation Results")
-    print(f"✅ Passed: {passed}/{total} ({success_rate:.1f}%)")
+    out.append("\n" + "=" * 75)
+    out.append(f"📊 Acceptance Criteria Validation Results")
+    out.append(f"✅ Passed: {passed}/{total} ({success_rate:.1f}%)")
     
     if success_rate >= 90:
-        print("🎉 EXCELLENT! All critical acceptance criteria have been met!")
-        return True
+        out.append("🎉 EXCELLENT! All critical acceptance criteria have been met!")
     elif success_rate >= 80:
-        print("✅ GOOD! Most acceptance criteria have been met!")
-        return True
+        out.append("✅ GOOD! Most acceptance criteria have been met!")
     else:
-        print("⚠️  Some acceptance criteria need attention.")
-        return False
+        out.append("⚠️  Some acceptance criteria need attention.")
+    
+    write_lines(out)
+    return success_rate >= 80
 
 
 if __name__ == "__main__":
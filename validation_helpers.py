@@ -0,0 +1,35 @@
+"""
+Helpers shared by the root-level validation scripts.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, List
+
+
+@lru_cache(maxsize=None)
+def list_directory(directory: str) -> FrozenSet[str]:
+    """List a directory's entry names once, with a single scandir() pass."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def path_exists(path: str) -> bool:
+    """Check a path against its directory listing instead of stat()ing it.
+
+    Listings are cached per directory; call ``list_directory.cache_clear()``
+    at the start of each validation so it sees the current tree.
+    """
+    file_path = Path(path)
+    return file_path.name in list_directory(str(file_path.parent))
+
+
+def write_lines(lines: List[str]):
+    """Write a collected report to stdout in one call."""
+    # One write instead of a print() per line, each taking the stdout lock
+    sys.stdout.write("\n".join(lines) + "\n")